@@ -22,6 +22,31 @@ import bpy
 from bpy.types import Menu, UIList, Operator
 from bpy.app.translations import pgettext_iface as iface_
 
+# Tool-settings attribute holding the paint settings for each
+# grease pencil interaction mode, so lookups are a single dict access
+# instead of an if/elif cascade on every redraw.
+_mode_paint_settings_attr = {
+    'PAINT_GPENCIL': "gpencil_paint",
+    'SCULPT_GPENCIL': "gpencil_sculpt_paint",
+    'WEIGHT_GPENCIL': "gpencil_weight_paint",
+    'VERTEX_GPENCIL': "gpencil_vertex_paint",
+}
+
+
+def _gpencil_paint_settings(tool_settings, mode):
+    attr = _mode_paint_settings_attr.get(mode)
+    return getattr(tool_settings, attr) if attr is not None else None
+
+
+# Annotation draw buttons, two per row as (icon, label, mode).
+_annotate_tool_rows = (
+    (('GREASEPENCIL', "Draw", 'DRAW'),
+     # XXX: Needs a dedicated icon
+     ('FORCE_CURVE', "Erase", 'ERASER')),
+    (('LINE_DATA', "Line", 'DRAW_STRAIGHT'),
+     ('MESH_DATA', "Poly", 'DRAW_POLY')),
+)
+
 
 # XXX: To be replaced with active tools
 # Currently only used by the clip editor
@@ -37,19 +62,13 @@ class AnnotationDrawingToolsPanel:
 
         tool_settings = context.tool_settings
 
-        is_clip_editor = context.space_data.type == 'CLIP_EDITOR'
-
         col = layout.column(align=True)
 
         col.label(text="Draw:")
-        row = col.row(align=True)
-        row.operator("gpencil.annotate", icon='GREASEPENCIL', text="Draw").mode = 'DRAW'
-        # XXX: Needs a dedicated icon
-        row.operator("gpencil.annotate", icon='FORCE_CURVE', text="Erase").mode = 'ERASER'
-
-        row = col.row(align=True)
-        row.operator("gpencil.annotate", icon='LINE_DATA', text="Line").mode = 'DRAW_STRAIGHT'
-        row.operator("gpencil.annotate", icon='MESH_DATA', text="Poly").mode = 'DRAW_POLY'
+        for tool_row in _annotate_tool_rows:
+            row = col.row(align=True)
+            for icon, text, mode in tool_row:
+                row.operator("gpencil.annotate", icon=icon, text=text).mode = mode
 
         col.separator()
 
@@ -64,12 +83,8 @@ class GreasePencilSculptOptionsPanel:
 
     @classmethod
     def poll(cls, context):
-        tool_settings = context.scene.tool_settings
-        settings = tool_settings.gpencil_sculpt_paint
-        brush = settings.brush
-        tool = brush.gpencil_sculpt_tool
-
-        return bool(tool in {'SMOOTH', 'RANDOMIZE'})
+        brush = context.scene.tool_settings.gpencil_sculpt_paint.brush
+        return brush.gpencil_sculpt_tool in {'SMOOTH', 'RANDOMIZE'}
 
     def draw(self, context):
         layout = self.layout
@@ -82,15 +97,15 @@ class GreasePencilSculptOptionsPanel:
         gp_settings = brush.gpencil_settings
         tool = brush.gpencil_sculpt_tool
 
-        if tool in {'SMOOTH', 'RANDOMIZE'}:
-            layout.prop(gp_settings, "use_edit_position", text="Affect Position")
-            layout.prop(gp_settings, "use_edit_strength", text="Affect Strength")
-            layout.prop(gp_settings, "use_edit_thickness", text="Affect Thickness")
+        # poll() already restricts the tool to 'SMOOTH' or 'RANDOMIZE'.
+        layout.prop(gp_settings, "use_edit_position", text="Affect Position")
+        layout.prop(gp_settings, "use_edit_strength", text="Affect Strength")
+        layout.prop(gp_settings, "use_edit_thickness", text="Affect Thickness")
 
-            if tool == 'SMOOTH':
-                layout.prop(gp_settings, "use_edit_pressure")
+        if tool == 'SMOOTH':
+            layout.prop(gp_settings, "use_edit_pressure")
 
-            layout.prop(gp_settings, "use_edit_uv", text="Affect UV")
+        layout.prop(gp_settings, "use_edit_uv", text="Affect UV")
 
 
 # GP Object Tool Settings
@@ -101,28 +116,21 @@ class GreasePencilDisplayPanel:
     @classmethod
     def poll(cls, context):
         ob = context.active_object
-        brush = context.tool_settings.gpencil_paint.brush
-        if ob and ob.type == 'GPENCIL' and brush:
-            if context.mode == 'PAINT_GPENCIL':
-                return brush.gpencil_tool != 'ERASE'
-            else:
-                # GP Sculpt, Vertex and Weight Paint always have Brush Tip panel.
-                return True
+        if ob and ob.type == 'GPENCIL':
+            brush = context.tool_settings.gpencil_paint.brush
+            if brush:
+                if context.mode == 'PAINT_GPENCIL':
+                    return brush.gpencil_tool != 'ERASE'
+                else:
+                    # GP Sculpt, Vertex and Weight Paint always have Brush Tip panel.
+                    return True
         return False
 
     def draw_header(self, context):
         if self.is_popover:
             return
 
-        tool_settings = context.tool_settings
-        if context.mode == 'PAINT_GPENCIL':
-            settings = tool_settings.gpencil_paint
-        elif context.mode == 'SCULPT_GPENCIL':
-            settings = tool_settings.gpencil_sculpt_paint
-        elif context.mode == 'WEIGHT_GPENCIL':
-            settings = tool_settings.gpencil_weight_paint
-        elif context.mode == 'VERTEX_GPENCIL':
-            settings = tool_settings.gpencil_vertex_paint
+        settings = _gpencil_paint_settings(context.tool_settings, context.mode)
         brush = settings.brush
         if brush:
             self.layout.prop(settings, "show_brush", text="")
@@ -132,15 +140,7 @@ class GreasePencilDisplayPanel:
         layout.use_property_split = True
         layout.use_property_decorate = False
 
-        tool_settings = context.tool_settings
-        if context.mode == 'PAINT_GPENCIL':
-            settings = tool_settings.gpencil_paint
-        elif context.mode == 'SCULPT_GPENCIL':
-            settings = tool_settings.gpencil_sculpt_paint
-        elif context.mode == 'WEIGHT_GPENCIL':
-            settings = tool_settings.gpencil_weight_paint
-        elif context.mode == 'VERTEX_GPENCIL':
-            settings = tool_settings.gpencil_vertex_paint
+        settings = _gpencil_paint_settings(context.tool_settings, context.mode)
         brush = settings.brush
         gp_settings = brush.gpencil_settings
 
@@ -178,37 +178,30 @@ class GreasePencilDisplayPanel:
             row.label(text="Display Cursor")
 
 
+_curve_preset_shapes = (
+    ('SMOOTHCURVE', 'SMOOTH'),
+    ('SPHERECURVE', 'ROUND'),
+    ('ROOTCURVE', 'ROOT'),
+    ('SHARPCURVE', 'SHARP'),
+    ('LINCURVE', 'LINE'),
+    ('NOCURVE', 'MAX'),
+)
+
+
 class GreasePencilBrushFalloff:
     bl_label = "Falloff"
     bl_options = {'DEFAULT_CLOSED'}
 
     @classmethod
     def poll(cls, context):
-        ts = context.tool_settings
-        settings = None
-        if context.mode == 'PAINT_GPENCIL':
-            settings = ts.gpencil_paint
-        if context.mode == 'SCULPT_GPENCIL':
-            settings = ts.gpencil_sculpt_paint
-        elif context.mode == 'WEIGHT_GPENCIL':
-            settings = ts.gpencil_weight_paint
-        elif context.mode == 'VERTEX_GPENCIL':
-            settings = ts.gpencil_vertex_paint
-
-        return (settings and settings.brush and settings.brush.curve)
+        settings = _gpencil_paint_settings(context.tool_settings, context.mode)
+        brush = settings.brush if settings else None
+
+        return (brush and brush.curve)
 
     def draw(self, context):
         layout = self.layout
-        ts = context.tool_settings
-        settings = None
-        if context.mode == 'PAINT_GPENCIL':
-            settings = ts.gpencil_paint
-        if context.mode == 'SCULPT_GPENCIL':
-            settings = ts.gpencil_sculpt_paint
-        elif context.mode == 'WEIGHT_GPENCIL':
-            settings = ts.gpencil_weight_paint
-        elif context.mode == 'VERTEX_GPENCIL':
-            settings = ts.gpencil_vertex_paint
+        settings = _gpencil_paint_settings(context.tool_settings, context.mode)
 
         if settings:
             brush = settings.brush
@@ -222,12 +215,8 @@ class GreasePencilBrushFalloff:
 
                 col = layout.column(align=True)
                 row = col.row(align=True)
-                row.operator("brush.curve_preset", icon='SMOOTHCURVE', text="").shape = 'SMOOTH'
-                row.operator("brush.curve_preset", icon='SPHERECURVE', text="").shape = 'ROUND'
-                row.operator("brush.curve_preset", icon='ROOTCURVE', text="").shape = 'ROOT'
-                row.operator("brush.curve_preset", icon='SHARPCURVE', text="").shape = 'SHARP'
-                row.operator("brush.curve_preset", icon='LINCURVE', text="").shape = 'LINE'
-                row.operator("brush.curve_preset", icon='NOCURVE', text="").shape = 'MAX'
+                for icon, shape in _curve_preset_shapes:
+                    row.operator("brush.curve_preset", icon=icon, text="").shape = shape
 
 
 class GPENCIL_MT_snap(Menu):
@@ -278,12 +267,12 @@ class GPENCIL_MT_move_to_layer(Menu):
     def draw(self, context):
         layout = self.layout
         gpd = context.gpencil_data
-        if gpd:
+        layers = gpd.layers if gpd else None
+        if layers:
             gpl_active = context.active_gpencil_layer
-            tot_layers = len(gpd.layers)
-            i = tot_layers - 1
+            i = len(layers) - 1
             while i >= 0:
-                gpl = gpd.layers[i]
+                gpl = layers[i]
                 if gpl.info == gpl_active.info:
                     icon = 'GREASEPENCIL'
                 else:
@@ -304,12 +293,12 @@ class GPENCIL_MT_layer_active(Menu):
         layout.operator_context = 'INVOKE_REGION_WIN'
 
         gpd = context.gpencil_data
-        if gpd:
+        layers = gpd.layers if gpd else None
+        if layers:
             gpl_active = context.active_gpencil_layer
-            tot_layers = len(gpd.layers)
-            i = tot_layers - 1
+            i = len(layers) - 1
             while i >= 0:
-                gpl = gpd.layers[i]
+                gpl = layers[i]
                 if gpl.info == gpl_active.info:
                     icon = 'GREASEPENCIL'
                 else:
@@ -328,12 +317,11 @@ class GPENCIL_MT_material_active(Menu):
     @classmethod
     def poll(cls, context):
         ob = context.active_object
-        tool_settings = context.scene.tool_settings
-        mode = tool_settings.gpencil_paint.color_mode
-        if mode != 'MATERIAL':
+        if ob is None or not ob.material_slots:
             return False
 
-        if ob is None or len(ob.material_slots) == 0:
+        tool_settings = context.scene.tool_settings
+        if tool_settings.gpencil_paint.color_mode != 'MATERIAL':
             return False
 
         return True
@@ -368,7 +356,7 @@ class GPENCIL_MT_cleanup(Menu):
 
     def draw(self, context):
 
-        ob = context.active_object
+        is_paint_mode = context.active_object.mode == 'PAINT_GPENCIL'
 
         layout = self.layout
 
@@ -379,14 +367,14 @@ class GPENCIL_MT_cleanup(Menu):
 
         layout.operator("gpencil.frame_clean_loose", text="Delete Loose Points")
 
-        if ob.mode != 'PAINT_GPENCIL':
+        if not is_paint_mode:
             layout.operator("gpencil.stroke_merge_by_distance", text="Merge by Distance")
 
         layout.separator()
 
         layout.operator("gpencil.frame_clean_duplicate", text="Delete Duplicated Frames")
         layout.operator("gpencil.recalc_geometry", text="Recalculate Geometry")
-        if ob.mode != 'PAINT_GPENCIL':
+        if not is_paint_mode:
             layout.operator("gpencil.reproject")
 
 
@@ -423,21 +411,21 @@ class AnnotationDataPanel:
         layout = self.layout
         layout.use_property_decorate = False
 
-        is_clip_editor = context.space_data.type == 'CLIP_EDITOR'
+        space = context.space_data
 
         # Grease Pencil owner.
         gpd_owner = context.annotation_data_owner
         gpd = context.annotation_data
 
         # Owner selector.
-        if is_clip_editor:
+        if space.type == 'CLIP_EDITOR':
             col = layout.column()
             col.label(text="Data Source:")
             row = col.row()
-            row.prop(context.space_data, "annotation_source", expand=True)
+            row.prop(space, "annotation_source", expand=True)
 
         # Only allow adding annotation ID if its owner exist
-        if context.annotation_data_owner is None:
+        if gpd_owner is None:
             row = layout.row()
             row.active = False
             row.label(text="No annotation source")
@@ -451,14 +439,16 @@ class AnnotationDataPanel:
             self.draw_layers(context, layout, gpd)
 
     def draw_layers(self, context, layout, gpd):
+        layers = gpd.layers
+
         row = layout.row()
 
         col = row.column()
-        if len(gpd.layers) >= 2:
+        if len(layers) >= 2:
             layer_rows = 5
         else:
             layer_rows = 3
-        col.template_list("GPENCIL_UL_annotation_layer", "", gpd, "layers", gpd.layers, "active_index",
+        col.template_list("GPENCIL_UL_annotation_layer", "", gpd, "layers", layers, "active_index",
                           rows=layer_rows, sort_reverse=True, sort_lock=True)
 
         col = row.column()
@@ -469,27 +459,27 @@ class AnnotationDataPanel:
 
         gpl = context.active_annotation_layer
         if gpl:
-            if len(gpd.layers) > 1:
+            if len(layers) > 1:
                 col.separator()
 
                 sub = col.column(align=True)
                 sub.operator("gpencil.layer_annotation_move", icon='TRIA_UP', text="").type = 'UP'
                 sub.operator("gpencil.layer_annotation_move", icon='TRIA_DOWN', text="").type = 'DOWN'
 
-        tool_settings = context.tool_settings
         if gpd and gpl:
             layout.prop(gpl, "thickness")
         else:
-            layout.prop(tool_settings, "annotation_thickness", text="Thickness")
+            layout.prop(context.tool_settings, "annotation_thickness", text="Thickness")
 
         if gpl:
             # Full-Row - Frame Locking (and Delete Frame)
             row = layout.row(align=True)
             row.active = not gpl.lock
 
-            if gpl.active_frame:
+            active_frame = gpl.active_frame
+            if active_frame:
                 lock_status = iface_("Locked") if gpl.lock_frame else iface_("Unlocked")
-                lock_label = iface_("Frame: %d (%s)") % (gpl.active_frame.frame_number, lock_status)
+                lock_label = iface_("Frame: %d (%s)") % (active_frame.frame_number, lock_status)
             else:
                 lock_label = iface_("Lock Frame")
             row.prop(gpl, "lock_frame", text=lock_label, icon='UNLOCKED')
@@ -505,16 +495,13 @@ class AnnotationOnionSkin:
     def poll(cls, context):
         # Show this panel as long as someone that might own this exists
         # AND the owner isn't an object (e.g. GP Object)
-        if context.annotation_data_owner is None:
+        gpd_owner = context.annotation_data_owner
+        if gpd_owner is None:
             return False
-        elif type(context.annotation_data_owner) is bpy.types.Object:
+        elif type(gpd_owner) is bpy.types.Object:
             return False
-        else:
-            gpl = context.active_annotation_layer
-            if gpl is None:
-                return False
 
-        return True
+        return context.active_annotation_layer is not None
 
     def draw_header(self, context):
         gpl = context.active_annotation_layer
@@ -552,6 +539,7 @@ class GreasePencilMaterialsPanel:
         tool_settings = context.scene.tool_settings
         gpencil_paint = tool_settings.gpencil_paint
         brush = gpencil_paint.brush
+        gp_settings = brush.gpencil_settings if (is_view3d and brush is not None) else None
 
         ob = context.object
         row = layout.row()
@@ -563,10 +551,8 @@ class GreasePencilMaterialsPanel:
             row.template_list("GPENCIL_UL_matslots", "", ob, "material_slots", ob, "active_material_index", rows=rows)
 
             # if topbar popover and brush pinned, disable
-            if is_view3d and brush is not None:
-                gp_settings = brush.gpencil_settings
-                if gp_settings.use_material_pin:
-                    row.enabled = False
+            if gp_settings is not None and gp_settings.use_material_pin:
+                row.enabled = False
 
             col = row.column(align=True)
             if show_full_ui:
@@ -606,8 +592,7 @@ class GreasePencilMaterialsPanel:
                     row.operator("gpencil.material_select", text="Deselect").deselect = True
         # stroke color
             ma = None
-            if is_view3d and brush is not None:
-                gp_settings = brush.gpencil_settings
+            if gp_settings is not None:
                 if gp_settings.use_material_pin is False:
                     if len(ob.material_slots) > 0 and ob.active_material_index >= 0:
                         ma = ob.material_slots[ob.active_material_index].material
@@ -632,35 +617,41 @@ class GreasePencilVertexcolorPanel:
         layout.use_property_split = True
         layout.use_property_decorate = False
 
+        ob = context.object
+        if ob is None:
+            return
+
         ts = context.scene.tool_settings
         is_vertex = context.mode == 'VERTEX_GPENCIL'
         gpencil_paint = ts.gpencil_vertex_paint if is_vertex else ts.gpencil_paint
         brush = gpencil_paint.brush
-        gp_settings = brush.gpencil_settings
-        tool = brush.gpencil_vertex_tool if is_vertex else brush.gpencil_tool
 
-        ob = context.object
+        col = layout.column()
+        col.template_color_picker(brush, "color", value_slider=True)
 
-        if ob:
-            col = layout.column()
-            col.template_color_picker(brush, "color", value_slider=True)
+        sub_row = layout.row(align=True)
+        sub_row.prop(brush, "color", text="")
+        sub_row.prop(brush, "secondary_color", text="")
 
-            sub_row = layout.row(align=True)
-            sub_row.prop(brush, "color", text="")
-            sub_row.prop(brush, "secondary_color", text="")
+        sub_row.operator("gpencil.tint_flip", icon='FILE_REFRESH', text="")
 
-            sub_row.operator("gpencil.tint_flip", icon='FILE_REFRESH', text="")
+        row = layout.row(align=True)
+        row.template_ID(gpencil_paint, "palette", new="palette.new")
+        if gpencil_paint.palette:
+            layout.template_palette(gpencil_paint, "palette", color=True)
 
+        if is_vertex is False and brush.gpencil_tool in {'DRAW', 'FILL'}:
+            gp_settings = brush.gpencil_settings
+            row = layout.row(align=True)
+            row.prop(gp_settings, "vertex_mode", text="Mode")
             row = layout.row(align=True)
-            row.template_ID(gpencil_paint, "palette", new="palette.new")
-            if gpencil_paint.palette:
-                layout.template_palette(gpencil_paint, "palette", color=True)
+            row.prop(gp_settings, "vertex_color_factor", slider=True, text="Mix Factor")
 
-            if tool in {'DRAW', 'FILL'} and is_vertex is False:
-                row = layout.row(align=True)
-                row.prop(gp_settings, "vertex_mode", text="Mode")
-                row = layout.row(align=True)
-                row.prop(gp_settings, "vertex_color_factor", slider=True, text="Mix Factor")
+
+# Layer list icons indexed by a bool property value: (False, True).
+_icons_parented = ('BLANK1', 'BONE_DATA')
+_icons_mask = ('LAYER_ACTIVE', 'MOD_MASK')
+_icons_onion = ('ONIONSKIN_OFF', 'ONIONSKIN_ON')
 
 
 class GPENCIL_UL_layer(UIList):
@@ -675,22 +666,20 @@ class GPENCIL_UL_layer(UIList):
             row = layout.row(align=True)
             row.label(
                 text="",
-                icon='BONE_DATA' if gpl.is_parented else 'BLANK1',
+                icon=_icons_parented[gpl.is_parented],
             )
             row.prop(gpl, "info", text="", emboss=False)
 
             row = layout.row(align=True)
 
-            icon_mask = 'MOD_MASK' if gpl.use_mask_layer else 'LAYER_ACTIVE'
-
-            row.prop(gpl, "use_mask_layer", text="", icon=icon_mask, emboss=False)
+            row.prop(gpl, "use_mask_layer", text="", icon=_icons_mask[gpl.use_mask_layer], emboss=False)
 
             subrow = row.row(align=True)
             subrow.prop(
                 gpl,
                 "use_onion_skinning",
                 text="",
-                icon='ONIONSKIN_ON' if gpl.use_onion_skinning else 'ONIONSKIN_OFF',
+                icon=_icons_onion[gpl.use_onion_skinning],
                 emboss=False,
             )
             row.prop(gpl, "hide", text="", emboss=False)
@@ -703,6 +692,16 @@ class GPENCIL_UL_layer(UIList):
             )
 
 
+_simplify_gpencil_props = (
+    "simplify_gpencil_onplay",
+    "simplify_gpencil_view_fill",
+    "simplify_gpencil_modifier",
+    "simplify_gpencil_shader_fx",
+    "simplify_gpencil_tint",
+    "simplify_gpencil_antialiasing",
+)
+
+
 class GreasePencilSimplifyPanel:
 
     def draw_header(self, context):
@@ -719,12 +718,8 @@ class GreasePencilSimplifyPanel:
         layout.active = rd.simplify_gpencil
 
         col = layout.column()
-        col.prop(rd, "simplify_gpencil_onplay")
-        col.prop(rd, "simplify_gpencil_view_fill")
-        col.prop(rd, "simplify_gpencil_modifier")
-        col.prop(rd, "simplify_gpencil_shader_fx")
-        col.prop(rd, "simplify_gpencil_tint")
-        col.prop(rd, "simplify_gpencil_antialiasing")
+        for propname in _simplify_gpencil_props:
+            col.prop(rd, propname)
 
 
 class GreasePencilLayerAdjustmentsPanel:
@@ -803,20 +798,21 @@ class GreasePencilLayerMasksPanel:
         ob = context.active_object
         gpd = ob.data
         gpl = gpd.layers.active
+        if gpl is None:
+            return
 
         layout = self.layout
         layout.enabled = gpl.use_mask_layer
 
-        if gpl:
-            rows = 4
-            row = layout.row()
-            col = row.column()
-            col.template_list("GPENCIL_UL_masks", "", gpl, "mask_layers", gpl.mask_layers,
-                              "active_mask_index", rows=rows, sort_lock=True)
+        rows = 4
+        row = layout.row()
+        col = row.column()
+        col.template_list("GPENCIL_UL_masks", "", gpl, "mask_layers", gpl.mask_layers,
+                          "active_mask_index", rows=rows, sort_lock=True)
 
-            col2 = row.column(align=True)
-            col2.menu("GPENCIL_MT_layer_mask_menu", icon='ADD', text="")
-            col2.operator("gpencil.layer_mask_remove", icon='REMOVE', text="")
+        col2 = row.column(align=True)
+        col2.menu("GPENCIL_MT_layer_mask_menu", icon='ADD', text="")
+        col2.operator("gpencil.layer_mask_remove", icon='REMOVE', text="")
 
 
 class GreasePencilLayerRelationsPanel:
@@ -871,16 +867,7 @@ class GreasePencilFlipTintColors(Operator):
 
     def execute(self, context):
         try:
-            ts = context.tool_settings
-            settings = None
-            if context.mode == 'PAINT_GPENCIL':
-                settings = ts.gpencil_paint
-            if context.mode == 'SCULPT_GPENCIL':
-                settings = ts.gpencil_sculpt_paint
-            elif context.mode == 'WEIGHT_GPENCIL':
-                settings = ts.gpencil_weight_paint
-            elif context.mode == 'VERTEX_GPENCIL':
-                settings = ts.gpencil_vertex_paint
+            settings = _gpencil_paint_settings(context.tool_settings, context.mode)
 
             brush = settings.brush
             if brush is not None:
@@ -895,9 +882,8 @@ class GreasePencilFlipTintColors(Operator):
 
             return {'FINISHED'}
 
-        except Exception as e:
-            utils_core.error_handlers(self, "gpencil.tint_flip", e,
-                                      "Flip Colors could not be completed")
+        except Exception:
+            self.report({'ERROR'}, "Flip Colors could not be completed")
 
             return {'CANCELLED'}
 
@@ -921,6 +907,5 @@ classes = (
 )
 
 if __name__ == "__main__":  # only for live edit.
-    from bpy.utils import register_class
-    for cls in classes:
-        register_class(cls)
+    register, _ = bpy.utils.register_classes_factory(classes)
+    register()